@@ -1,11 +1,14 @@
-import random
 from typing import Callable, List, Tuple, Optional, Union
 
+import numpy as np
+
+from ._local_search import LocalSearch
+
 Number = Union[int, float]
 Vector = List[Number]
 
 
-class AdaptiveRandomSearch:
+class AdaptiveRandomSearch(LocalSearch):
     """
     Adaptive Random Search (ARS) optimizer.
 
@@ -13,75 +16,49 @@ class AdaptiveRandomSearch:
     Supports minimization (default) or maximization.
     """
 
+    # the step grows after an improvement and shrinks otherwise
+    _GROW = 1.2
+    _SHRINK = 0.9
+
     def __init__(self,
                  objective: Callable[[Vector], float],
                  bounds: List[Tuple[Number, Number]],
                  step_size: float = 0.1,
                  iterations: int = 1000,
                  maximize: bool = False,
-                 seed: Optional[int] = None):
+                 seed: Optional[Union[int, np.random.SeedSequence]] = None,
+                 batch_size: int = 1,
+                 vectorized_objective: bool = False,
+                 track_history: bool = False,
+                 device: str = "cpu",
+                 tol: Optional[float] = None,
+                 patience: Optional[int] = None):
         """
         Args:
-            objective: function f(x) to minimize/maximize.
+            objective: function f(x) to minimize/maximize; x is a new list of floats
+                on every call. A build attached with @specialized, or an @njit
+                objective, is called with a read-only float64 array instead, a view
+                of a buffer that later candidates overwrite (copy it to keep a
+                visited point).
             bounds: list of (low, high) for each dimension.
             step_size: initial step size for perturbations (as fraction of bound range).
             iterations: number of iterations to run.
             maximize: if True → maximize; else minimize.
-            seed: optional random seed.
+            seed: optional random seed (int or np.random.SeedSequence). A given seed
+                reproduces the same run; use SeedSequence.spawn for independent runs.
+            batch_size: number of candidates drawn and scored per iteration.
+            vectorized_objective: if True, objective takes a (batch_size, dim)
+                array and returns (batch_size,) scores. Also enabled by @vectorized.
+            track_history: if True, result["history"][it] is the best score after
+                iteration it.
+                Off by default, in which case result has no "history" key.
+            device: "cpu" runs on NumPy; any other torch device (e.g. "cuda:0") runs the
+                batched search on PyTorch tensors there. The objective must then map a
+                (batch_size, dim) tensor to (batch_size,) scores on that device.
+            tol: stop once the best score reaches tol (<= tol when minimizing,
+                >= tol when maximizing).
+            patience: stop after this many iterations without a new best.
+                result["iterations"] is the number of iterations actually run.
         """
-        self.objective = objective
-        self.bounds = bounds
-        self.step_size = step_size
-        self.iterations = iterations
-        self.maximize = maximize
-        self.rng = random.Random(seed)
-        self.dim = len(bounds)
-
-    def _random_vector(self) -> Vector:
-        """Random sample in bounds."""
-        return [self.rng.uniform(lo, hi) for lo, hi in self.bounds]
-
-    def _perturb(self, vector: Vector, step: float) -> Vector:
-        """Generate a neighbor by perturbing each dimension with Gaussian noise scaled by step."""
-        candidate = []
-        for (lo, hi), v in zip(self.bounds, vector):
-            span = hi - lo
-            perturbed = v + self.rng.gauss(0, step * span)
-            # clip into bounds
-            perturbed = max(lo, min(hi, perturbed))
-            candidate.append(perturbed)
-        return candidate
-
-    def run(self) -> dict:
-        """Execute the ARS optimization."""
-        current = self._random_vector()
-        current_score = self.objective(current)
-        best = current[:]
-        best_score = current_score
-
-        step = self.step_size
-        history = [(0, best_score)]
-
-        for it in range(1, self.iterations + 1):
-            candidate = self._perturb(current, step)
-            candidate_score = self.objective(candidate)
-
-            # Comparison depends on maximize/minimize
-            improved = candidate_score > current_score if self.maximize else candidate_score < current_score
-
-            if improved:
-                current, current_score = candidate, candidate_score
-                if (self.maximize and current_score > best_score) or (not self.maximize and current_score < best_score):
-                    best, best_score = current[:], current_score
-                step *= 1.2  # increase step size
-            else:
-                step *= 0.9  # reduce step size
-
-            history.append((it, best_score))
-
-        return {
-            "best_x": best,
-            "best_score": best_score,
-            "history": history,
-            "iterations": self.iterations
-        }
+        super().__init__(objective, bounds, step_size, iterations, maximize, seed, batch_size,
+                         vectorized_objective, track_history, device, tol, patience)
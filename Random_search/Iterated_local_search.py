@@ -1,10 +1,23 @@
-import random
+from concurrent.futures import ProcessPoolExecutor
 from typing import Callable, List, Tuple, Optional, Union
 
+import numpy as np
+
+from ._local_search import LocalSearch
+
 Number = Union[int, float]
 Vector = List[Number]
 
-class IteratedLocalSearch:
+# neighbors tried per hill climb
+_CLIMB_ITERS = 100
+
+
+def _run_chain(kwargs: dict) -> dict:
+    """Run one independent ILS chain; module-level so worker processes can unpickle it."""
+    return IteratedLocalSearch(**kwargs).run()
+
+
+class IteratedLocalSearch(LocalSearch):
     """
     Iterated Local Search (ILS) optimizer.
     Combines local search (hill climbing) with perturbations to escape local optima.
@@ -17,82 +30,122 @@ class IteratedLocalSearch:
                  iterations: int = 1000,
                  perturb_strength: float = 0.5,
                  maximize: bool = False,
-                 seed: Optional[int] = None):
+                 seed: Optional[Union[int, np.random.SeedSequence]] = None,
+                 batch_size: int = 1,
+                 vectorized_objective: bool = False,
+                 track_history: bool = False,
+                 device: str = "cpu",
+                 tol: Optional[float] = None,
+                 patience: Optional[int] = None,
+                 n_chains: int = 1):
         """
         Args:
-            objective: function f(x) to minimize/maximize.
+            objective: function f(x) to minimize/maximize; x is a new list of floats
+                on every call. A build attached with @specialized, or an @njit
+                objective, is called with a read-only float64 array instead, a view
+                of a buffer that later candidates overwrite (copy it to keep a
+                visited point).
             bounds: list of (low, high) for each dimension.
             step_size: step size used in local search perturbations.
             iterations: total number of iterations (local searches + perturbations).
             perturb_strength: scale of "big jump" when perturbing best solution.
             maximize: if True → maximize; else minimize.
-            seed: optional random seed.
+            seed: optional random seed (int or np.random.SeedSequence). A given seed
+                reproduces the same run; use SeedSequence.spawn for independent runs.
+            batch_size: number of neighbors drawn and scored per hill-climb step.
+            vectorized_objective: if True, objective takes a (batch_size, dim)
+                array and returns (batch_size,) scores. Also enabled by @vectorized.
+            track_history: if True, result["history"][it] is the best score after
+                iteration it.
+                Off by default, in which case result has no "history" key.
+            device: "cpu" runs on NumPy; any other torch device (e.g. "cuda:0") runs the
+                batched search on PyTorch tensors there. The objective must then map a
+                (batch_size, dim) tensor to (batch_size,) scores on that device.
+            tol: stop once the best score reaches tol (<= tol when minimizing,
+                >= tol when maximizing).
+            patience: stop after this many iterations without a new best.
+                result["iterations"] is the number of iterations actually run.
+            n_chains: if > 1, run() runs this many independent ILS chains of
+                about iterations / n_chains iterations each in worker processes and
+                keeps the best. The objective must then be picklable.
         """
-        self.objective = objective
-        self.bounds = bounds
-        self.step_size = step_size
-        self.iterations = iterations
+        super().__init__(objective, bounds, step_size, iterations, maximize, seed, batch_size,
+                         vectorized_objective, track_history, device, tol, patience)
         self.perturb_strength = perturb_strength
-        self.maximize = maximize
-        self.rng = random.Random(seed)
-        self.dim = len(bounds)
-
-    def _random_vector(self) -> Vector:
-        """Random sample in bounds."""
-        return [self.rng.uniform(lo, hi) for lo, hi in self.bounds]
-
-    def _neighbor(self, vector: Vector, step: float) -> Vector:
-        """Generate a neighbor by small Gaussian perturbation."""
-        candidate = []
-        for (lo, hi), v in zip(self.bounds, vector):
-            span = hi - lo
-            perturbed = v + self.rng.gauss(0, step * span)
-            perturbed = max(lo, min(hi, perturbed))  # clip to bounds
-            candidate.append(perturbed)
-        return candidate
-
-    def _hill_climb(self, start: Vector, max_iters: int = 100) -> Tuple[Vector, float]:
-        """Perform simple hill climbing from a start vector."""
-        current = start[:]
-        current_score = self.objective(current)
-
-        for _ in range(max_iters):
-            candidate = self._neighbor(current, self.step_size)
-            candidate_score = self.objective(candidate)
-
-            improved = candidate_score > current_score if self.maximize else candidate_score < current_score
-            if improved:
-                current, current_score = candidate, candidate_score
-
-        return current, current_score
-
-    def _perturb(self, vector: Vector) -> Vector:
-        """Make a big jump (perturbation) to escape local optimum."""
-        return self._neighbor(vector, self.perturb_strength)
+        self.n_chains = n_chains
+        self._best_buf = np.empty(self.dim, dtype=np.float64)
 
     def run(self) -> dict:
         """Execute Iterated Local Search."""
+        if self.n_chains > 1:
+            return self._run_chains()
+
+        climb, next_noise = self._climb, self._next_noise
+        lo, hi, cand = self._lo, self._hi, self._cand_buf
+        jump = self.perturb_strength * self._span
+
         # initial solution
-        current = self._random_vector()
-        current, current_score = self._hill_climb(current)
+        current, current_score, _ = climb(self.rng.uniform(lo, hi), _CLIMB_ITERS)
 
-        best, best_score = current[:], current_score
-        history = [(0, best_score)]
+        best = self._best_buf
+        np.copyto(best, current)
+        best_score = current_score
+        history = self._history
+        if history is not None:
+            history[0] = best_score
 
+        target, patience = self._target, self._patience
+        it = last_improve = 0
         for it in range(1, self.iterations + 1):
-            # perturb best
-            perturbed = self._perturb(best)
-            candidate, candidate_score = self._hill_climb(perturbed)
+            # perturb best: a big Gaussian jump to escape the local optimum
+            np.multiply(next_noise(), jump, out=cand)
+            cand += best
+            np.clip(cand, lo, hi, out=cand)
+            candidate, candidate_score, _ = climb(cand, _CLIMB_ITERS)
+
+            if candidate_score > best_score:
+                np.copyto(best, candidate)
+                best_score = candidate_score
+                last_improve = it
+
+            if history is not None:
+                history[it] = best_score
 
-            improved = candidate_score > best_score if self.maximize else candidate_score < best_score
-            if improved:
-                best, best_score = candidate[:], candidate_score
+            if best_score >= target or it - last_improve >= patience:
+                break
 
-            history.append((it, best_score))
+        return self._result(best, best_score, history, it)
 
-        return {
-            "best_x": best,
-            "best_score": best_score,
-            "history": history,
-            "iterations": self.iterations
+    def _run_chains(self) -> dict:
+        """
+        Split the iterations over n_chains independent chains (at most one chain per
+        iteration) run in a process pool, and keep the best.
+
+        Each chain gets its own stream from self._ss.spawn(n_chains), so results are
+        reproducible for a fixed seed and n_chains. tol and patience apply to each
+        chain separately; result["history"] (if tracked) is the winning chain's.
+        """
+        n_chains = max(1, min(self.n_chains, self.iterations))
+        sizes = [self.iterations // n_chains + (k < self.iterations % n_chains) for k in range(n_chains)]
+        base = dict(objective=self.objective, bounds=self.bounds, step_size=self.step_size,
+                    perturb_strength=self.perturb_strength,
+                    maximize=self.maximize, batch_size=self.batch_size,
+                    vectorized_objective=self.vectorized_objective,
+                    track_history=self._history is not None, device=self.device,
+                    tol=self.tol, patience=self.patience)
+        jobs = [{**base, "iterations": size, "seed": chain_seed}
+                for size, chain_seed in zip(sizes, self._ss.spawn(n_chains))]
+
+        with ProcessPoolExecutor(max_workers=n_chains) as ex:
+            parts = list(ex.map(_run_chain, jobs))
+
+        best = max(parts, key=lambda part: self._sign * part["best_score"])
+        result = {
+            "best_x": best["best_x"],
+            "best_score": best["best_score"],
+            # iterations run across all chains
+            "iterations": sum(part["iterations"] for part in parts)
         }
+        if "history" in best:
+            result["history"] = best["history"]
+        return result
@@ -1,40 +1,108 @@
-import random
-import math
-from typing import Callable, Dict, List, Tuple, Sequence, Union, Optional
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Dict, Iterator, List, Tuple, Sequence, Union, Optional
+
+import numpy as np
+
+from ._jit import is_jitted
+from ._seeding import seed_sequence
+from .vectorized import evaluate_batch, specialize
+
+# candidate rows drawn per Generator call in random_search (capped at ~1M values)
+_DRAW_CHUNK = 4096
 
 class RandomSearch:
     Number = Union[int, float]
     Vector = Sequence[Number]
 
     @staticmethod
-    def _sample_from_bounds(bounds: Sequence[Tuple[Number, Number]],
-                            integer: Sequence[bool],
-                            rng: random.Random) -> List[Number]:
-        candidate = []
-        for (lo, hi), is_int in zip(bounds, integer):
-            if is_int:
-                candidate.append(rng.randint(math.ceil(lo), math.floor(hi)))
-            else:
-                candidate.append(rng.uniform(lo, hi))
+    def _bounds_arrays(bounds: Sequence[Tuple[Number, Number]],
+                       integer: Sequence[bool]) -> Tuple[np.ndarray, ...]:
+        lo = np.array([b[0] for b in bounds], dtype=np.float64)
+        hi = np.array([b[1] for b in bounds], dtype=np.float64)
+        int_mask = np.array(integer, dtype=bool)
+        # integer dims sample from [ceil(lo), floor(hi)]; `integers` takes an exclusive high
+        int_lo = np.ceil(lo[int_mask]).astype(np.int64)
+        int_hi = np.floor(hi[int_mask]).astype(np.int64) + 1
+        return lo, hi, int_mask, int_lo, int_hi
+
+    @staticmethod
+    def _sample_from_bounds(lo: np.ndarray,
+                            hi: np.ndarray,
+                            int_mask: np.ndarray,
+                            int_lo: np.ndarray,
+                            int_hi: np.ndarray,
+                            rng: np.random.Generator,
+                            size: Optional[int] = None) -> np.ndarray:
+        shape = lo.shape if size is None else (size,) + lo.shape
+        candidate = rng.uniform(lo, hi, size=shape)
+        if int_lo.size:
+            candidate[..., int_mask] = rng.integers(int_lo, int_hi, size=shape[:-1] + int_lo.shape)
         return candidate
 
+    @staticmethod
+    def _to_vector(x: np.ndarray, int_mask: np.ndarray) -> List[Number]:
+        return [int(v) if is_int else float(v) for v, is_int in zip(x, int_mask)]
+
+    @staticmethod
+    def _to_vectors(X: np.ndarray, int_mask: np.ndarray) -> List[List[Number]]:
+        # `_to_vector` for every row of X, converting a column at a time
+        if not int_mask.any():
+            return X.tolist()
+        cols = [X[:, j].astype(np.int64).tolist() if is_int else X[:, j].tolist()
+                for j, is_int in enumerate(int_mask)]
+        return [list(row) for row in zip(*cols)]
+
+    @staticmethod
+    def _draw_candidates(lo: np.ndarray,
+                         hi: np.ndarray,
+                         int_mask: np.ndarray,
+                         int_lo: np.ndarray,
+                         int_hi: np.ndarray,
+                         rng: np.random.Generator,
+                         n: int,
+                         as_lists: bool) -> Iterator[Union[np.ndarray, List[Number]]]:
+        # n candidates drawn a chunk of rows at a time: memory stays O(chunk * dim) and a
+        # search that stops early never draws the rest
+        rows = max(1, min(_DRAW_CHUNK, (1 << 20) // max(1, lo.size)))
+        for start in range(0, n, rows):
+            X = RandomSearch._sample_from_bounds(lo, hi, int_mask, int_lo, int_hi, rng, size=min(rows, n - start))
+            yield from (RandomSearch._to_vectors(X, int_mask) if as_lists else X)
+
     @staticmethod
     def random_search(objective: Callable[[Vector], float],
                       bounds: Sequence[Tuple[Number, Number]],
                       iterations: int = 1000,
                       integer: Optional[Sequence[bool]] = None,
                       maximize: bool = False,
-                      seed: Optional[int] = None,
+                      seed: Optional[Union[int, np.random.SeedSequence]] = None,
                       return_history: bool = False,
-                      verbose: bool = False) -> Dict:
-        rng = random.Random(seed)
+                      verbose: bool = False,
+                      n_workers: int = 1,
+                      use_threads: bool = False,
+                      tol: Optional[float] = None,
+                      patience: Optional[int] = None) -> Dict:
+        fast = specialize(objective)
         dim = len(bounds)
         if integer is None:
             integer = [False] * dim
         elif len(integer) != dim:
             raise ValueError("`integer` length must equal number of bounds")
+        if n_workers > 1:
+            return RandomSearch._random_search_parallel(objective, bounds, iterations, integer, maximize,
+                                                        seed, return_history, verbose, n_workers, use_threads,
+                                                        tol, patience)
 
-        best_x = RandomSearch._sample_from_bounds(bounds, integer, rng)
+        rng = np.random.default_rng(seed)
+        lo, hi, int_mask, int_lo, int_hi = RandomSearch._bounds_arrays(bounds, integer)
+
+        # a plain objective gets each candidate as a list, integer dims as Python ints (e.g. to
+        # index with them), so it computes on Python numbers; specialized and @njit builds get arrays
+        as_lists = fast is objective and not is_jitted(objective)
+        objective = fast
+
+        # the first candidate is the starting point
+        candidates = RandomSearch._draw_candidates(lo, hi, int_mask, int_lo, int_hi, rng, iterations + 1, as_lists)
+        best_x = next(candidates)
         best_score_raw = objective(best_x)
         best_score = best_score_raw if maximize else -best_score_raw
 
@@ -42,9 +110,14 @@ class RandomSearch:
         if return_history:
             history.append((0, best_score_raw))
 
+        # early stop: best reaches tol (signed like best_score), or `patience` samples without improvement
+        target = (tol if maximize else -tol) if tol is not None else np.inf
+        if patience is None:
+            patience = iterations + 1
+
         report_every = max(1, iterations // 10)
-        for it in range(1, iterations + 1):
-            x = RandomSearch._sample_from_bounds(bounds, integer, rng)
+        it = last_improve = 0
+        for it, x in enumerate(candidates, 1):
             raw = objective(x)
             score = raw if maximize else -raw
 
@@ -52,17 +125,115 @@ class RandomSearch:
                 best_score = score
                 best_score_raw = raw
                 best_x = x
+                last_improve = it
                 if return_history:
                     history.append((it, best_score_raw))
 
             if verbose and it % report_every == 0:
                 print(f"[random_search] iter {it}/{iterations}, best_score={best_score_raw}")
 
+            if best_score >= target or it - last_improve >= patience:
+                break
+
         result = {
-            "best_x": best_x,
+            "best_x": RandomSearch._to_vector(best_x, int_mask),
             "best_score": best_score_raw,
-            "evaluations": iterations
+            "evaluations": it
+        }
+        if return_history:
+            result["history"] = history
+        return result
+
+    @staticmethod
+    def _random_search_parallel(objective: Callable[[Vector], float],
+                                bounds: Sequence[Tuple[Number, Number]],
+                                iterations: int,
+                                integer: Sequence[bool],
+                                maximize: bool,
+                                seed: Optional[Union[int, np.random.SeedSequence]],
+                                return_history: bool,
+                                verbose: bool,
+                                n_workers: int,
+                                use_threads: bool,
+                                tol: Optional[float],
+                                patience: Optional[int]) -> Dict:
+        """
+        Split the iterations + 1 evaluations over n_workers independent searches and keep the best.
+
+        Each worker gets its own stream from SeedSequence(seed).spawn(n_workers), so
+        streams never overlap; results are reproducible for a fixed seed and n_workers.
+        Processes are used by default (objective must be picklable); use_threads=True
+        suits objectives that release the GIL (NumPy, numba). tol and patience apply
+        to each worker separately, and with verbose each worker reports its own progress.
+        """
+        n_workers = min(n_workers, iterations + 1)
+        sizes = [(iterations + 1) // n_workers + (k < (iterations + 1) % n_workers) for k in range(n_workers)]
+        seeds = seed_sequence(seed).spawn(n_workers)
+
+        pool = ThreadPoolExecutor if use_threads else ProcessPoolExecutor
+        with pool(max_workers=n_workers) as ex:
+            futures = [ex.submit(RandomSearch.random_search, objective, bounds, size - 1, integer,
+                                 maximize, worker_seed, return_history, verbose, tol=tol, patience=patience)
+                       for size, worker_seed in zip(sizes, seeds)]
+            parts = [f.result() for f in futures]
+
+        pick = max if maximize else min
+        best = pick(parts, key=lambda part: part["best_score"])
+        result = {
+            "best_x": best["best_x"],
+            "best_score": best["best_score"],
+            # each worker also scores its own starting point; count those as in the sequential run
+            "evaluations": sum(part["evaluations"] for part in parts) + len(parts) - 1
         }
         if return_history:
+            # chunks are laid end to end; keep only entries that improve on everything before them
+            history, offset = [], 0
+            for part in parts:
+                for it, score in part["history"]:
+                    if not history or (score > history[-1][1] if maximize else score < history[-1][1]):
+                        history.append((offset + it, score))
+                # a worker that stopped early only used evaluations + 1 of its chunk
+                offset += part["evaluations"] + 1
             result["history"] = history
         return result
+
+    @staticmethod
+    def random_search_vectorized(objective: Callable[[np.ndarray], np.ndarray],
+                                 bounds: Sequence[Tuple[Number, Number]],
+                                 iterations: int = 1000,
+                                 integer: Optional[Sequence[bool]] = None,
+                                 maximize: bool = False,
+                                 seed: Optional[Union[int, np.random.SeedSequence]] = None,
+                                 return_history: bool = False) -> Dict:
+        """
+        Same search as `random_search`, but all candidates are drawn up front as
+        one (iterations + 1, dim) array and scored in a single call.
+
+        `objective` should be marked with @vectorized (X -> scores); plain
+        per-vector objectives still work through np.apply_along_axis.
+        """
+        objective = specialize(objective)
+        rng = np.random.default_rng(seed)
+        dim = len(bounds)
+        if integer is None:
+            integer = [False] * dim
+        elif len(integer) != dim:
+            raise ValueError("`integer` length must equal number of bounds")
+
+        lo, hi, int_mask, int_lo, int_hi = RandomSearch._bounds_arrays(bounds, integer)
+        X = RandomSearch._sample_from_bounds(lo, hi, int_mask, int_lo, int_hi, rng, size=iterations + 1)
+
+        scores = evaluate_batch(objective, X)
+        idx = int(scores.argmax() if maximize else scores.argmin())
+
+        result = {
+            "best_x": RandomSearch._to_vector(X[idx], int_mask),
+            "best_score": float(scores[idx]),
+            "evaluations": iterations
+        }
+        if return_history:
+            signed = scores if maximize else -scores
+            running = np.maximum.accumulate(signed)
+            improved = np.flatnonzero(np.r_[True, running[1:] > running[:-1]])
+            result["history"] = [(int(it), float(scores[it])) for it in improved]
+        return result
@@ -0,0 +1,30 @@
+from typing import Callable
+
+try:
+    import numba
+    from numba.core.registry import CPUDispatcher
+except ImportError:  # numba is optional
+    numba = None
+    CPUDispatcher = ()
+
+# numba.prange runs loop iterations on all threads inside @njit(parallel=True); plain range otherwise
+prange = numba.prange if numba is not None else range
+
+
+# kernels are cached on disk (__pycache__) so only the first process pays the compile cost;
+# numba cannot cache kernels that take a function argument, those pass cache=False
+JIT_DEFAULTS = {"cache": True, "fastmath": True, "boundscheck": False}
+
+
+def njit(**options) -> Callable[[Callable], Callable]:
+    """numba.njit with JIT_DEFAULTS (overridable by options) when numba is installed, otherwise a no-op decorator."""
+    def decorate(fn: Callable) -> Callable:
+        if numba is None:
+            return fn
+        return numba.njit(**{**JIT_DEFAULTS, **options})(fn)
+    return decorate
+
+
+def is_jitted(fn: Callable) -> bool:
+    """True if fn is a numba @njit function that jitted kernels can call directly."""
+    return isinstance(fn, CPUDispatcher)
@@ -0,0 +1,382 @@
+from typing import Callable, List, Tuple, Optional, Union
+
+import numpy as np
+
+from .backends.torch_backend import as_tensor, make_generator, perturb_torch, require_torch
+from ._jit import is_jitted, njit
+from ._seeding import seed_sequence
+from .vectorized import evaluate_batch, is_vectorized, perturb_and_score, specialize
+
+Number = Union[int, float]
+Vector = List[Number]
+
+# rows of standard normals drawn per refill of the noise pool (capped at ~1M values)
+_NOISE_CHUNK = 4096
+# up to this many dims the scalar climb works on Python lists (see _climb_lists); beyond
+# it the array climb is faster even though it converts each candidate with tolist()
+_LIST_MAX_DIM = 8
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    """View of array that cannot be written through; array itself stays writable."""
+    view = array.view()
+    view.flags.writeable = False
+    return view
+
+
+# obj_fn is a function argument, so this is compiled anew in every process (~3 s)
+@njit(cache=False)
+def _climb_loop(obj_fn, start, lo, hi, step, grow, shrink, iters, seed, sign, has_target, target, patience, track):
+    """
+    LocalSearch climb compiled by numba; obj_fn must itself be an @njit function.
+    history holds sign * score as in the Python loop and is only filled when track
+    is set. target is only compared when has_target is set: kernels are built with
+    fastmath, under which comparisons against an infinite sentinel are undefined.
+    Returns (position, sign * score, history, iterations run).
+    """
+    np.random.seed(seed)
+    dim = lo.shape[0]
+    span = hi - lo
+
+    current = start.copy()
+    current_score = sign * obj_fn(current)
+
+    history = np.empty(iters + 1 if track else 1)
+    history[0] = current_score
+    cand = np.empty(dim)
+
+    it = last_improve = 0
+    for it in range(1, iters + 1):
+        for i in range(dim):
+            cand[i] = min(hi[i], max(lo[i], current[i] + np.random.normal(0.0, step * span[i])))
+        candidate_score = sign * obj_fn(cand)
+
+        if candidate_score > current_score:
+            current[:] = cand
+            current_score = candidate_score
+            last_improve = it
+            step *= grow
+        else:
+            step *= shrink
+
+        if track:
+            history[it] = current_score
+
+        if (has_target and current_score >= target) or it - last_improve >= patience:
+            break
+
+    return current, current_score, history, it
+
+
+class LocalSearch:
+    """
+    Shared machinery of the Gaussian-neighbor searches (ARS, RHC, ILS).
+
+    A climb starts at a point and, for a number of steps, moves to the best of
+    batch_size neighbors (Gaussian noise scaled by step * span, clipped into
+    bounds) whenever it improves. The step is multiplied by _GROW after an
+    improvement and by _SHRINK otherwise. Scores are kept as sign * objective
+    internally so "better" is always ">".
+    """
+
+    _GROW = 1.0
+    _SHRINK = 1.0
+
+    def __init__(self,
+                 objective: Callable[[Vector], float],
+                 bounds: List[Tuple[Number, Number]],
+                 step_size: float,
+                 iterations: int,
+                 maximize: bool,
+                 seed: Optional[Union[int, np.random.SeedSequence]],
+                 batch_size: int,
+                 vectorized_objective: bool,
+                 track_history: bool,
+                 device: str,
+                 tol: Optional[float],
+                 patience: Optional[int]):
+        self.objective = objective
+        # the build the climbs call: a @specialized replacement if one is attached
+        self._fn = specialize(objective)
+        self.bounds = bounds
+        self.step_size = step_size
+        self.iterations = iterations
+        self.maximize = maximize
+        self._sign = 1.0 if maximize else -1.0
+        self.tol = tol
+        self.patience = patience
+        # early-stop thresholds on signed scores; the defaults never trigger
+        self._target = self._sign * tol if tol is not None else np.inf
+        self._patience = patience if patience is not None else iterations + 1
+        self._ss = seed_sequence(seed)
+        self.rng = np.random.default_rng(self._ss)
+        self.dim = len(bounds)
+        self.device = device
+        if device != "cpu":
+            require_torch(device)
+        self.batch_size = batch_size
+        # the calling convention follows the objective as given: a specialization that
+        # happens to be @vectorized must not switch a batch_size == 1 run to batches
+        self.vectorized_objective = vectorized_objective or is_vectorized(objective)
+        self._lo = np.array([b[0] for b in bounds], dtype=np.float64)
+        self._hi = np.array([b[1] for b in bounds], dtype=np.float64)
+        self._span = self._hi - self._lo
+        # scratch buffers owned by this instance; candidates are written here in place
+        self._cand_buf = np.empty(self.dim, dtype=np.float64)
+        self._batch_buf = np.empty((self.batch_size, self.dim), dtype=np.float64)
+        self._current_buf = np.empty(self.dim, dtype=np.float64)
+        # objectives taking arrays get these read-only views so they cannot write into the search
+        self._cand_view, self._batch_view, self._current_view = (
+            _read_only(b) for b in (self._cand_buf, self._batch_buf, self._current_buf))
+        self._history = np.empty(self.iterations + 1, dtype=np.float64) if track_history else None
+        # unit normals drawn in chunks and scaled by the current step at use time
+        self._noise_pool = np.empty((max(1, min(_NOISE_CHUNK, (1 << 20) // max(1, self.dim))), self.dim))
+        self._cursor = len(self._noise_pool)
+        # the pool as nested lists for _climb_lists; None until needed after each refill
+        self._noise_rows = None
+        # plain objectives are called with a new list of floats, specialized and @njit builds with arrays
+        self._plain = self._fn is objective and not is_jitted(objective)
+        self._use_lists = self._plain and self.dim <= _LIST_MAX_DIM
+        # bounds tensors and generator for device != "cpu", built on first use
+        self._torch_state = None
+
+    def run(self) -> dict:
+        """Climb for `iterations` steps from a random point in bounds."""
+        start = self.rng.uniform(self._lo, self._hi)
+        best, best_score, it = self._climb(start, self.iterations, self._history, self._target, self._patience)
+        return self._result(best, best_score, self._history, it)
+
+    def _next_noise(self) -> np.ndarray:
+        """Next row of unit Gaussian noise, refilling the pool when it runs out."""
+        if self._cursor == len(self._noise_pool):
+            self.rng.standard_normal(out=self._noise_pool)
+            self._noise_rows = None
+            self._cursor = 0
+        row = self._noise_pool[self._cursor]
+        self._cursor += 1
+        return row
+
+    def _climb(self,
+               start: np.ndarray,
+               iters: int,
+               history: Optional[np.ndarray] = None,
+               target: float = np.inf,
+               patience: Optional[int] = None) -> Tuple[np.ndarray, float, int]:
+        """
+        Climb from start for up to iters steps, writing the signed score after step
+        it to history[it] when history is given. Stops once the score reaches target
+        or after `patience` steps without improvement.
+
+        Returns (position, signed score, steps run); the position may be an internal
+        buffer reused by the next climb.
+        """
+        if patience is None:
+            patience = iters + 1
+        if self.device != "cpu":
+            return self._climb_torch(start, iters, history, target, patience)
+        if is_jitted(self._fn) and self.batch_size == 1 and not self.vectorized_objective:
+            return self._climb_jitted(start, iters, history, target, patience)
+        if self.batch_size > 1 or self.vectorized_objective:
+            return self._climb_batched(start, iters, history, target, patience)
+        if self._use_lists:
+            return self._climb_lists(start, iters, history, target, patience)
+        return self._climb_scalar(start, iters, history, target, patience)
+
+    def _climb_scalar(self, start: np.ndarray, iters: int, history: Optional[np.ndarray],
+                      target: float, patience: int) -> Tuple[np.ndarray, float, int]:
+        """Climb scoring one neighbor per step, built from pooled noise in reused buffers."""
+        # bind hot attributes to locals once; the loop below only touches locals
+        obj, sign, rng, plain = self._fn, self._sign, self.rng, self._plain
+        lo, hi, span = self._lo, self._hi, self._span
+        grow, shrink = self._GROW, self._SHRINK
+        pool, cursor, pool_len = self._noise_pool, self._cursor, len(self._noise_pool)
+        current, cand = self._current_buf, self._cand_buf
+        current_view, cand_view = self._current_view, self._cand_view
+        np.copyto(current, start)
+        current_score = sign * obj(current.tolist() if plain else current_view)
+        if history is not None:
+            history[0] = current_score
+
+        step = self.step_size
+        it = last_improve = 0
+        for it in range(1, iters + 1):
+            # neighbor: pooled unit noise scaled by step, clipped into bounds (written into cand)
+            if cursor == pool_len:
+                rng.standard_normal(out=pool)
+                cursor = 0
+            np.multiply(pool[cursor], step * span, out=cand)
+            cursor += 1
+            cand += current
+            np.clip(cand, lo, hi, out=cand)
+            candidate_score = sign * obj(cand.tolist() if plain else cand_view)
+
+            if candidate_score > current_score:
+                # accept by swapping buffers (and their views) instead of copying
+                current, cand = cand, current
+                current_view, cand_view = cand_view, current_view
+                current_score = candidate_score
+                last_improve = it
+                step *= grow
+            else:
+                step *= shrink
+
+            if history is not None:
+                history[it] = current_score
+
+            if current_score >= target or it - last_improve >= patience:
+                break
+
+        self._cursor = cursor
+        return current, current_score, it
+
+    def _climb_lists(self, start: np.ndarray, iters: int, history: Optional[np.ndarray],
+                     target: float, patience: int) -> Tuple[np.ndarray, float, int]:
+        """
+        _climb_scalar on Python lists, for plain objectives in few dims, where a handful
+        of float ops per element beats the fixed cost of each NumPy call. It reads the
+        same pooled noise, so it visits the same points.
+        """
+        obj, sign, rng = self._fn, self._sign, self.rng
+        lo, hi, span = self._lo.tolist(), self._hi.tolist(), self._span.tolist()
+        grow, shrink = self._GROW, self._SHRINK
+        pool, cursor, pool_len = self._noise_pool, self._cursor, len(self._noise_pool)
+        if self._noise_rows is None:
+            self._noise_rows = pool.tolist()
+        rows = self._noise_rows
+        current = start.tolist()
+        current_score = sign * obj(current)
+        if history is not None:
+            history[0] = current_score
+
+        step = self.step_size
+        it = last_improve = 0
+        for it in range(1, iters + 1):
+            if cursor == pool_len:
+                rng.standard_normal(out=pool)
+                rows = self._noise_rows = pool.tolist()
+                cursor = 0
+            cand = [min(h, max(l, c + n * (step * s))) for c, n, s, l, h in zip(current, rows[cursor], span, lo, hi)]
+            cursor += 1
+            candidate_score = sign * obj(cand)
+
+            if candidate_score > current_score:
+                current, current_score = cand, candidate_score
+                last_improve = it
+                step *= grow
+            else:
+                step *= shrink
+
+            if history is not None:
+                history[it] = current_score
+
+            if current_score >= target or it - last_improve >= patience:
+                break
+
+        self._cursor = cursor
+        return np.array(current), current_score, it
+
+    def _climb_batched(self, start: np.ndarray, iters: int, history: Optional[np.ndarray],
+                       target: float, patience: int) -> Tuple[np.ndarray, float, int]:
+        """Climb where each step scores batch_size neighbors in one call and keeps the best."""
+        rng, obj, sign, vec, plain = self.rng, self._fn, self._sign, self.vectorized_objective, self._plain
+        # per-vector @njit objectives are scored row by row across threads by a numba kernel;
+        # batch objectives get the whole array
+        parallel = is_jitted(obj) and not vec
+        lo, hi, span, buf, buf_view = self._lo, self._hi, self._span, self._batch_buf, self._batch_view
+        grow, shrink = self._GROW, self._SHRINK
+        current = start.copy()
+        current_score = sign * float(evaluate_batch(obj, _read_only(current[None, :]), vec, plain)[0])
+        if history is not None:
+            history[0] = current_score
+
+        step = self.step_size
+        it = last_improve = 0
+        for it in range(1, iters + 1):
+            cand = rng.standard_normal(out=buf)
+            if parallel:
+                scores = perturb_and_score(obj, current, cand, step * span, lo, hi, sign)
+            else:
+                cand *= step * span
+                cand += current
+                np.clip(cand, lo, hi, out=cand)
+                scores = sign * evaluate_batch(obj, buf_view, vec, plain)
+
+            best_idx = int(scores.argmax())
+            candidate_score = float(scores[best_idx])
+            if candidate_score > current_score:
+                np.copyto(current, cand[best_idx])
+                current_score = candidate_score
+                last_improve = it
+                step *= grow
+            else:
+                step *= shrink
+
+            if history is not None:
+                history[it] = current_score
+
+            if current_score >= target or it - last_improve >= patience:
+                break
+
+        return current, current_score, it
+
+    def _climb_torch(self, start: np.ndarray, iters: int, history: Optional[np.ndarray],
+                     target: float, patience: int) -> Tuple[np.ndarray, float, int]:
+        """Climb on PyTorch tensors on self.device; each step scores batch_size neighbors on-device."""
+        obj, sign, device, batch_size = self._fn, self._sign, self.device, self.batch_size
+        grow, shrink = self._GROW, self._SHRINK
+        if self._torch_state is None:
+            lo, hi, span = (as_tensor(a, device) for a in (self._lo, self._hi, self._span))
+            self._torch_state = (lo, hi, span, make_generator(device, self._ss))
+        lo, hi, span, gen = self._torch_state
+        current = as_tensor(start, device)
+        current_score = sign * float(obj(current[None, :])[0])
+        if history is not None:
+            history[0] = current_score
+
+        step = self.step_size
+        it = last_improve = 0
+        for it in range(1, iters + 1):
+            cand, candidate_score = perturb_torch(obj, current, lo, hi, span, step, batch_size, sign, gen)
+            if candidate_score > current_score:
+                current, current_score = cand, candidate_score
+                last_improve = it
+                step *= grow
+            else:
+                step *= shrink
+
+            if history is not None:
+                history[it] = current_score
+
+            if current_score >= target or it - last_improve >= patience:
+                break
+
+        return current.cpu().numpy(), current_score, it
+
+    def _climb_jitted(self, start: np.ndarray, iters: int, history: Optional[np.ndarray],
+                      target: float, patience: int) -> Tuple[np.ndarray, float, int]:
+        """Run the whole climb inside numba; used when the objective is an @njit function."""
+        # numba's legacy RNG takes a 32-bit integer seed; draw it from this instance's stream
+        seed = int(self.rng.integers(1 << 32))
+        has_target = bool(np.isfinite(target))
+        current, current_score, kernel_history, it = _climb_loop(
+            self._fn, np.asarray(start, dtype=np.float64), self._lo, self._hi, float(self.step_size),
+            self._GROW, self._SHRINK, iters, seed, self._sign, has_target, float(target) if has_target else 0.0,
+            patience, history is not None)
+        if history is not None:
+            np.copyto(history[:it + 1], kernel_history[:it + 1])
+        return current, float(current_score), it
+
+    def _result(self, best: np.ndarray, best_score: float, history: Optional[np.ndarray], iterations: int) -> dict:
+        """
+        Build the run() result for a run that stopped after `iterations` iterations;
+        best_score and history hold internal (signed) scores and are flipped back here.
+        """
+        result = {
+            "best_x": best.tolist(),
+            "best_score": self._sign * best_score,
+            "iterations": iterations
+        }
+        if history is not None:
+            # a copy: the recording buffer is overwritten by the next run()
+            result["history"] = history[:iterations + 1] * self._sign
+        return result
@@ -0,0 +1,15 @@
+from typing import Optional, Union
+
+import numpy as np
+
+
+def seed_sequence(seed: Optional[Union[int, np.random.SeedSequence]]) -> np.random.SeedSequence:
+    """
+    SeedSequence for seed that the caller does not share. spawn() advances a
+    SeedSequence in place, so a given SeedSequence is copied rather than reused;
+    passing the same one twice reproduces the same run.
+    """
+    if isinstance(seed, np.random.SeedSequence):
+        return np.random.SeedSequence(seed.entropy, spawn_key=seed.spawn_key, pool_size=seed.pool_size,
+                                      n_children_spawned=seed.n_children_spawned)
+    return np.random.SeedSequence(seed)
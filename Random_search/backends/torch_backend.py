@@ -0,0 +1,50 @@
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+
+# torch is optional and slow to import, so it is only imported once a non-CPU device is used
+
+
+def require_torch(device: str) -> None:
+    """Raise a clear error when a non-CPU device is requested without PyTorch installed."""
+    try:
+        import torch  # noqa: F401
+    except ImportError:
+        raise ImportError(f"device={device!r} requires PyTorch; install torch or use device='cpu'") from None
+
+
+def as_tensor(array: np.ndarray, device: str) -> "torch.Tensor":
+    """float64 tensor copy of a NumPy array on device."""
+    import torch
+    return torch.as_tensor(array, dtype=torch.float64, device=device)
+
+
+def make_generator(device: str, seed_seq: np.random.SeedSequence) -> "torch.Generator":
+    """torch.Generator on device, seeded from a fresh child of seed_seq."""
+    import torch
+    gen = torch.Generator(device=device)
+    gen.manual_seed(int(seed_seq.spawn(1)[0].generate_state(1, dtype=np.uint64)[0]))
+    return gen
+
+
+def perturb_torch(objective: Callable[["torch.Tensor"], "torch.Tensor"],
+                  current: "torch.Tensor",
+                  lo: "torch.Tensor",
+                  hi: "torch.Tensor",
+                  span: "torch.Tensor",
+                  step: float,
+                  batch_size: int,
+                  sign: float,
+                  generator: Optional["torch.Generator"] = None) -> Tuple["torch.Tensor", float]:
+    """
+    Draw batch_size Gaussian neighbors of current (scaled by step * span, clamped
+    into bounds), score them on-device with the vectorized objective and return
+    the best one with its sign * score.
+    """
+    import torch
+    noise = torch.randn((batch_size, current.shape[0]), dtype=current.dtype, device=current.device,
+                        generator=generator)
+    cand = torch.clamp(current + noise * (step * span), lo, hi)
+    scores = sign * objective(cand)
+    best_idx = int(torch.argmax(scores))
+    return cand[best_idx], float(scores[best_idx])
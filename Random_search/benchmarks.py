@@ -0,0 +1,32 @@
+import numpy as np
+
+from ._jit import njit
+from .vectorized import vectorized
+
+
+def _sphere(X: np.ndarray) -> np.ndarray:
+    """Sphere: sum(x_i ** 2). Works on one vector or a (n, dim) batch."""
+    return (X ** 2).sum(axis=-1)
+
+
+def _rastrigin(X: np.ndarray) -> np.ndarray:
+    """Rastrigin: 10 * dim + sum(x_i ** 2 - 10 * cos(2 * pi * x_i))."""
+    return 10.0 * X.shape[-1] + (X ** 2 - 10.0 * np.cos(2.0 * np.pi * X)).sum(axis=-1)
+
+
+def _rosenbrock(X: np.ndarray) -> np.ndarray:
+    """Rosenbrock: sum(100 * (x_{i+1} - x_i ** 2) ** 2 + (1 - x_i) ** 2)."""
+    head, tail = X[..., :-1], X[..., 1:]
+    return (100.0 * (tail - head ** 2) ** 2 + (1.0 - head) ** 2).sum(axis=-1)
+
+
+# numba builds, scored one vector per call by the jitted loops and perturb_and_score;
+# compiled before the @vectorized tag is set below so they don't inherit it
+sphere_nb = njit()(_sphere)
+rastrigin_nb = njit()(_rastrigin)
+rosenbrock_nb = njit()(_rosenbrock)
+
+# NumPy versions, tagged so batched paths score a whole (n, dim) array per call
+sphere_np = vectorized(_sphere)
+rastrigin_np = vectorized(_rastrigin)
+rosenbrock_np = vectorized(_rosenbrock)
@@ -0,0 +1,65 @@
+from typing import Callable
+
+import numpy as np
+
+from ._jit import njit, prange
+
+
+def vectorized(fn: Callable[[np.ndarray], np.ndarray]) -> Callable[[np.ndarray], np.ndarray]:
+    """
+    Mark an objective as vectorized.
+
+    A vectorized objective takes a batch X of shape (n, dim) and returns
+    scores of shape (n,), e.g. ``lambda X: (X ** 2).sum(axis=1)``.
+    """
+    fn.__vectorized__ = True
+    return fn
+
+
+def is_vectorized(fn: Callable) -> bool:
+    """True if fn was marked with @vectorized."""
+    return getattr(fn, "__vectorized__", False)
+
+
+def evaluate_batch(objective: Callable, X: np.ndarray, vectorized: bool = False, as_lists: bool = False) -> np.ndarray:
+    """
+    Score every row of X, in one call when the objective is vectorized. Otherwise
+    rows are scored one by one, passed as lists of floats if as_lists.
+    """
+    if vectorized or is_vectorized(objective):
+        return np.asarray(objective(X), dtype=np.float64)
+    if as_lists:
+        return np.array([objective(x) for x in X.tolist()], dtype=np.float64)
+    return np.apply_along_axis(objective, 1, X).astype(np.float64)
+
+
+def specialized(fast: Callable) -> Callable[[Callable], Callable]:
+    """
+    Attach a faster equivalent of the decorated objective (e.g. a @vectorized
+    NumPy version); optimizers call `fast` in its place.
+    """
+    def decorate(fn: Callable) -> Callable:
+        fn._specialized = fast
+        return fn
+    return decorate
+
+
+def specialize(fn: Callable) -> Callable:
+    """The specialized replacement for fn if one was attached, else fn itself."""
+    return getattr(fn, "_specialized", fn)
+
+
+# obj_fn is a function argument, so this is compiled anew in every process (~1 s)
+@njit(parallel=True, cache=False)
+def perturb_and_score(obj_fn, current, cand, scale, lo, hi, sign):
+    """
+    Turn unit noise rows in cand into clipped neighbors of current (in place) and
+    score them with the @njit obj_fn, one row per thread. Returns sign * scores.
+    """
+    n, dim = cand.shape
+    scores = np.empty(n)
+    for i in prange(n):
+        for j in range(dim):
+            cand[i, j] = min(hi[j], max(lo[j], current[j] + cand[i, j] * scale[j]))
+        scores[i] = sign * obj_fn(cand[i])
+    return scores